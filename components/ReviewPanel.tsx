@@ -1,4 +1,4 @@
-import React, { useEffect, useMemo, useState } from 'react';
+import React, { useEffect, useMemo, useRef, useState } from 'react';
 import type { ExtractedField, FileData } from '../types';
 import {
   AlertTriangle,
@@ -31,6 +31,13 @@ export const ReviewPanel: React.FC<ReviewPanelProps> = ({
   const [activeField, setActiveField] = useState<number | null>(null);
   const [previewUrl, setPreviewUrl] = useState<string | null>(null);
   const [filterMode, setFilterMode] = useState<FilterMode>('ALL');
+  // Zuletzt für die Preview erzeugtes PDF. Der Download nimmt es wieder, wenn
+  // sich die Felder seitdem nicht geändert haben, statt neu zu rendern.
+  const lastRender = useRef<{
+    fields: ExtractedField[];
+    formFile: FileData;
+    bytes: Uint8Array;
+  } | null>(null);
 
   const verifiedCount = fields.filter((f) => f.isVerified).length;
   const totalCount = fields.length;
@@ -47,6 +54,7 @@ export const ReviewPanel: React.FC<ReviewPanelProps> = ({
     const handle = setTimeout(async () => {
       try {
         const bytes = await createFilledPdf(formFile.base64, fields);
+        lastRender.current = { fields, formFile, bytes };
         if (!active) return;
         const blob = new Blob([bytes as BlobPart], { type: 'application/pdf' });
         const url = URL.createObjectURL(blob);
@@ -105,7 +113,11 @@ export const ReviewPanel: React.FC<ReviewPanelProps> = ({
   };
 
   const handleDownload = async () => {
-    const bytes = await createFilledPdf(formFile.base64, fields);
+    const cached = lastRender.current;
+    const bytes =
+      cached && cached.fields === fields && cached.formFile === formFile
+        ? cached.bytes
+        : await createFilledPdf(formFile.base64, fields);
     const blob = new Blob([bytes as BlobPart], { type: 'application/pdf' });
     const url = URL.createObjectURL(blob);
     const a = document.createElement('a');
@@ -117,22 +129,30 @@ export const ReviewPanel: React.FC<ReviewPanelProps> = ({
     setTimeout(() => URL.revokeObjectURL(url), 0);
   };
 
-  const displayedFields = fields
-    .map((f, i) => ({ ...f, originalIndex: i }))
-    .sort((a, b) => {
-      const aAttn = a.validation?.status !== 'VALID';
-      const bAttn = b.validation?.status !== 'VALID';
-      if (aAttn && !bAttn) return -1;
-      if (!aAttn && bAttn) return 1;
-      if (!a.isVerified && b.isVerified) return -1;
-      if (a.isVerified && !b.isVerified) return 1;
-      return a.originalIndex - b.originalIndex;
-    })
-    .filter(
-      (f) =>
-        filterMode === 'ALL' ||
-        (f.validation?.status !== 'VALID' && !f.isVerified)
-    );
+  // Nur Indizes sortieren/filtern — die Feld-Objekte werden nicht bei jedem
+  // Render (also jedem Tastendruck) kopiert.
+  const displayedIndices = useMemo(
+    () =>
+      fields
+        .map((_, i) => i)
+        .filter(
+          (i) =>
+            filterMode === 'ALL' ||
+            (fields[i].validation?.status !== 'VALID' && !fields[i].isVerified)
+        )
+        .sort((ai, bi) => {
+          const a = fields[ai];
+          const b = fields[bi];
+          const aAttn = a.validation?.status !== 'VALID';
+          const bAttn = b.validation?.status !== 'VALID';
+          if (aAttn && !bAttn) return -1;
+          if (!aAttn && bAttn) return 1;
+          if (!a.isVerified && b.isVerified) return -1;
+          if (a.isVerified && !b.isVerified) return 1;
+          return ai - bi;
+        }),
+    [fields, filterMode]
+  );
 
   return (
     <div className="max-w-7xl mx-auto px-4 py-8 h-[calc(100vh-80px)] flex flex-col">
@@ -247,8 +267,8 @@ export const ReviewPanel: React.FC<ReviewPanelProps> = ({
           </div>
 
           <div className="flex-1 overflow-y-auto p-4 space-y-3 bg-kng-bg">
-            {displayedFields.map((field) => {
-              const idx = field.originalIndex;
+            {displayedIndices.map((idx) => {
+              const field = fields[idx];
               const status = field.validation?.status ?? 'VALID';
               const isVerified = !!field.isVerified;
 
@@ -56,6 +56,67 @@ function describeType(t: string): string {
   }
 }
 
+// Statischer Teil des Prompts (Arbeitsregeln + Antwortformat). Hängt nicht
+// vom Request ab und wird deshalb einmal beim Laden gebaut statt pro Job.
+const PROMPT_INSTRUCTIONS = [
+  'Lies das TARGET-Formular und alle Quelldateien/Text mit dem Read-Tool.',
+  'Extrahiere die Werte aus den Quellen und mappe sie auf die Feldnamen',
+  'des TARGET. Quellen können sich überschneiden — bei Widersprüchen',
+  'nimm den plausibelsten Wert und setze validation.status = "WARNING".',
+  '',
+  'ARBEITSREGELN (non-negotiable):',
+  '',
+  '1. STICHWORTSTIL, KEIN GUTACHTEN — kurze Einträge, keine ausformulierten',
+  '   Sätze. "Akute Lumboischialgie" statt "Der Patient leidet seit …".',
+  '',
+  '2. FESTE ZEICHEN-KÄSTCHEN OHNE LEERZEICHEN — bei VSNR, IBAN, BIC,',
+  '   Institutionskennzeichen (IK), Postleitzahl etc. werden die Zeichen in',
+  '   einzelne Kästchen geschrieben. Zusammenhängend ohne Leerzeichen/Punkte',
+  '   /Bindestriche ausgeben, auch wenn die Quelle sie enthält.',
+  '   Beispiel: Quelle "12 340567 A 005" → value "12340567A005".',
+  '',
+  '3. VORDRUCKE RESPEKTIEREN — wenn das Formular ein Präfix schon druckt',
+  '   (z.B. "DE" vor der IBAN, "€" vor dem Betrag), NICHT nochmal',
+  '   mitschreiben. Nur den variablen Teil ins Feld.',
+  '',
+  '4. RICHTIGES FELD — gleiche Labels können mehrfach vorkommen',
+  '   (Antragsteller vs. Zahlungsempfänger, erste vs. Folgeseite).',
+  '   Feldname und Umfeld analysieren, Wert in den passenden Abschnitt.',
+  '',
+  '5. NUR MEDIZINISCH — Sozialbereich (Familienstand, Einkommen,',
+  '   Wohnsituation jenseits der Adresse) bleibt leer, außer explizit',
+  '   in den Quellen enthalten.',
+  '',
+  '6. KEINE GERATENEN WERTE — bei Unsicherheit: value="" und',
+  '   validation.status="WARNING" mit Begründung. Nicht halluzinieren.',
+  '   Lieber leer lassen als falsch ausfüllen.',
+  '',
+  'FORMAT-REGELN:',
+  '- Datum: DD.MM.YYYY',
+  '- Zahlen: Komma als Dezimaltrenner, Punkt als Tausendertrenner',
+  '- Checkbox/Button (Btn): value="X" wenn angekreuzt, value="" sonst',
+  '',
+  'Wenn ein Feld aus den Quellen nicht sicher ableitbar ist:',
+  '  value="" und validation.status="WARNING" mit Begründung.',
+  'Wenn ein Feld klar kein Match hat: value="" und status="VALID".',
+  '',
+  'ANTWORTE NUR mit einem JSON-Objekt in diesem Format,',
+  'ohne Markdown-Codefence, ohne Kommentar davor oder danach:',
+  '',
+  '{',
+  '  "summary": "kurze Beschreibung was verarbeitet wurde",',
+  '  "fields": [',
+  '    {',
+  '      "key": "<exakter Feldname aus Liste>",',
+  '      "label": "<menschenlesbar>",',
+  '      "value": "<Wert oder leer>",',
+  '      "sourceContext": "<Textsnippet aus der jeweiligen Quelle>",',
+  '      "validation": { "status": "VALID|WARNING|INVALID", "message": "...", "suggestion": "..." }',
+  '    }',
+  '  ]',
+  '}',
+].join('\n');
+
 function buildPrompt(tempDir: string, args: RunClaudeArgs): string {
   const formPath = path.join(tempDir, args.formFilename);
   const sourcePaths = args.sourceFilenames.map((n) => path.join(tempDir, n));
@@ -88,68 +149,16 @@ function buildPrompt(tempDir: string, args: RunClaudeArgs): string {
     'AcroForm-Felder im TARGET:',
     fieldList,
     '',
-    'Lies das TARGET-Formular und alle Quelldateien/Text mit dem Read-Tool.',
-    'Extrahiere die Werte aus den Quellen und mappe sie auf die Feldnamen',
-    'des TARGET. Quellen können sich überschneiden — bei Widersprüchen',
-    'nimm den plausibelsten Wert und setze validation.status = "WARNING".',
-    '',
-    'ARBEITSREGELN (non-negotiable):',
-    '',
-    '1. STICHWORTSTIL, KEIN GUTACHTEN — kurze Einträge, keine ausformulierten',
-    '   Sätze. "Akute Lumboischialgie" statt "Der Patient leidet seit …".',
-    '',
-    '2. FESTE ZEICHEN-KÄSTCHEN OHNE LEERZEICHEN — bei VSNR, IBAN, BIC,',
-    '   Institutionskennzeichen (IK), Postleitzahl etc. werden die Zeichen in',
-    '   einzelne Kästchen geschrieben. Zusammenhängend ohne Leerzeichen/Punkte',
-    '   /Bindestriche ausgeben, auch wenn die Quelle sie enthält.',
-    '   Beispiel: Quelle "12 340567 A 005" → value "12340567A005".',
-    '',
-    '3. VORDRUCKE RESPEKTIEREN — wenn das Formular ein Präfix schon druckt',
-    '   (z.B. "DE" vor der IBAN, "€" vor dem Betrag), NICHT nochmal',
-    '   mitschreiben. Nur den variablen Teil ins Feld.',
-    '',
-    '4. RICHTIGES FELD — gleiche Labels können mehrfach vorkommen',
-    '   (Antragsteller vs. Zahlungsempfänger, erste vs. Folgeseite).',
-    '   Feldname und Umfeld analysieren, Wert in den passenden Abschnitt.',
-    '',
-    '5. NUR MEDIZINISCH — Sozialbereich (Familienstand, Einkommen,',
-    '   Wohnsituation jenseits der Adresse) bleibt leer, außer explizit',
-    '   in den Quellen enthalten.',
-    '',
-    '6. KEINE GERATENEN WERTE — bei Unsicherheit: value="" und',
-    '   validation.status="WARNING" mit Begründung. Nicht halluzinieren.',
-    '   Lieber leer lassen als falsch ausfüllen.',
-    '',
-    'FORMAT-REGELN:',
-    '- Datum: DD.MM.YYYY',
-    '- Zahlen: Komma als Dezimaltrenner, Punkt als Tausendertrenner',
-    '- Checkbox/Button (Btn): value="X" wenn angekreuzt, value="" sonst',
-    '',
-    'Wenn ein Feld aus den Quellen nicht sicher ableitbar ist:',
-    '  value="" und validation.status="WARNING" mit Begründung.',
-    'Wenn ein Feld klar kein Match hat: value="" und status="VALID".',
-    '',
-    'ANTWORTE NUR mit einem JSON-Objekt in diesem Format,',
-    'ohne Markdown-Codefence, ohne Kommentar davor oder danach:',
-    '',
-    '{',
-    '  "summary": "kurze Beschreibung was verarbeitet wurde",',
-    '  "fields": [',
-    '    {',
-    '      "key": "<exakter Feldname aus Liste>",',
-    '      "label": "<menschenlesbar>",',
-    '      "value": "<Wert oder leer>",',
-    '      "sourceContext": "<Textsnippet aus der jeweiligen Quelle>",',
-    '      "validation": { "status": "VALID|WARNING|INVALID", "message": "...", "suggestion": "..." }',
-    '    }',
-    '  ]',
-    '}',
+    PROMPT_INSTRUCTIONS,
   ].join('\n');
 }
 
+// Ohne g-Flag, damit die Instanz zustandslos (kein lastIndex) wiederverwendbar ist.
+const CODE_FENCE_RE = /^```(?:json)?\s*\n?([\s\S]*?)\n?```$/;
+
 function stripCodeFence(raw: string): string {
   const trimmed = raw.trim();
-  const fenceMatch = trimmed.match(/^```(?:json)?\s*\n?([\s\S]*?)\n?```$/);
+  const fenceMatch = trimmed.match(CODE_FENCE_RE);
   if (fenceMatch) return fenceMatch[1].trim();
   return trimmed;
 }
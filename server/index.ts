@@ -29,12 +29,16 @@ const ALLOWED_MIME = new Set([
   'image/webp',
 ]);
 
+// Eigener Fehlertyp für vom fileFilter abgelehnte Uploads — der Error-Handler
+// antwortet darauf mit 4xx statt mit dem generischen 500er.
+class UploadRejectedError extends Error {}
+
 const upload = multer({
   storage: multer.memoryStorage(),
   limits: { fileSize: MAX_FILE_BYTES, files: MAX_SOURCES + 1 },
   fileFilter: (_req, file, cb) => {
     if (!ALLOWED_MIME.has(file.mimetype)) {
-      cb(new Error(`Unsupported mime: ${file.mimetype}`));
+      cb(new UploadRejectedError(`Unsupported mime: ${file.mimetype}`));
       return;
     }
     cb(null, true);
@@ -220,12 +224,26 @@ app.get('/api/process/:jobId', (req: Request, res: Response) => {
 
 app.use((err: unknown, _req: Request, res: Response, _next: NextFunction) => {
   const msg = err instanceof Error ? err.message : String(err);
+  // Client-Fehler beim Upload (Limit überschritten, falscher MIME-Typ) sind
+  // kein Serverfehler: passender 4xx, kein Error-Log.
+  if (err instanceof multer.MulterError) {
+    const status = err.code === 'LIMIT_FILE_SIZE' ? 413 : 400;
+    res.status(status).json({ error: 'Upload abgelehnt', details: msg });
+    return;
+  }
+  if (err instanceof UploadRejectedError) {
+    res.status(415).json({ error: 'Dateityp nicht unterstützt', details: msg });
+    return;
+  }
   console.error('[server error]', msg);
   res.status(500).json({ error: 'Serverfehler beim Vorbereiten', details: msg });
 });
 
+// Konstanter Body — einmal serialisieren statt bei jedem Healthcheck-Poll.
+const HEALTH_BODY = JSON.stringify({ ok: true });
+
 app.get('/api/health', (_req, res) => {
-  res.json({ ok: true });
+  res.type('application/json').send(HEALTH_BODY);
 });
 
 // Production: statische Assets + SPA-Fallback auf index.html.
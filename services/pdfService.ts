@@ -56,13 +56,34 @@ interface WidgetInfo {
   fieldType: string;
 }
 
+// Uint8Array.fromBase64 ist noch nicht in der TS-lib (ES2022) — daher der
+// manuelle Typ. Wo vorhanden, dekodiert der Browser nativ statt per JS-Loop.
+type Uint8ArrayWithBase64 = typeof Uint8Array & {
+  fromBase64?: (base64: string) => Uint8Array;
+};
+
 function base64ToUint8Array(base64: string): Uint8Array {
+  const U8 = Uint8Array as Uint8ArrayWithBase64;
+  if (typeof U8.fromBase64 === 'function') return U8.fromBase64(base64);
+
   const binary = atob(base64);
   const bytes = new Uint8Array(binary.length);
   for (let i = 0; i < binary.length; i++) bytes[i] = binary.charCodeAt(i);
   return bytes;
 }
 
+// Das Ziel-PDF wird bei jeder Preview-Aktualisierung neu geladen. base64 nur
+// einmal dekodieren und pdfjs jeweils eine Kopie geben — getDocument()
+// transferiert den Buffer an den Worker, das Original wäre danach leer.
+let decodedPdf: { base64: string; bytes: Uint8Array } | null = null;
+
+function pdfBytesFor(base64: string): Uint8Array {
+  if (!decodedPdf || decodedPdf.base64 !== base64) {
+    decodedPdf = { base64, bytes: base64ToUint8Array(base64) };
+  }
+  return decodedPdf.bytes.slice();
+}
+
 async function collectWidgets(
   data: Uint8Array
 ): Promise<{ doc: pdfjs.PDFDocumentProxy; widgets: WidgetInfo[] }> {
@@ -71,9 +92,17 @@ async function collectWidgets(
   const doc = await loadingTask.promise;
   const widgets: WidgetInfo[] = [];
 
-  for (let pageIdx = 1; pageIdx <= doc.numPages; pageIdx++) {
-    const page = await doc.getPage(pageIdx);
-    const anns = await page.getAnnotations();
+  // Alle Seiten auf einmal anfragen statt Seite für Seite zu awaiten — sonst
+  // kostet jede Seite einen eigenen Worker-Roundtrip. Promise.all behält die
+  // Seitenreihenfolge bei.
+  const annsPerPage = await Promise.all(
+    Array.from({ length: doc.numPages }, async (_, i) => {
+      const page = await doc.getPage(i + 1);
+      return page.getAnnotations();
+    })
+  );
+
+  for (const anns of annsPerPage) {
     for (const ann of anns) {
       if (ann.subtype !== 'Widget') continue;
       if (!ann.fieldName) continue;
@@ -90,7 +119,7 @@ async function collectWidgets(
 
 export async function getPdfFields(base64: string): Promise<PdfFieldInfo[]> {
   try {
-    const data = base64ToUint8Array(base64);
+    const data = pdfBytesFor(base64);
     const { widgets } = await collectWidgets(data);
     const seen = new Set<string>();
     const unique: PdfFieldInfo[] = [];
@@ -110,7 +139,7 @@ export async function createFilledPdf(
   base64: string,
   fields: ExtractedField[]
 ): Promise<Uint8Array> {
-  const data = base64ToUint8Array(base64);
+  const data = pdfBytesFor(base64);
   const { doc, widgets } = await collectWidgets(data);
 
   const byName = new Map<string, ExtractedField>();
@@ -138,7 +167,9 @@ export async function createFilledPdf(
   return await doc.saveDocument();
 }
 
+const CHECKBOX_TRUTHY = new Set(['x', 'ja', 'yes', 'true', '1']);
+
 function isTruthyCheckbox(value: string): boolean {
-  const v = (value ?? '').trim().toLowerCase();
-  return v === 'x' || v === 'ja' || v === 'yes' || v === 'true' || v === '1';
+  if (!value) return false;
+  return CHECKBOX_TRUTHY.has(value.trim().toLowerCase());
 }